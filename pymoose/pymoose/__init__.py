@@ -61,6 +61,7 @@ from pymoose.edsl.base import sub
 from pymoose.edsl.base import sum
 from pymoose.edsl.base import transpose
 from pymoose.edsl.base import zeros
+from pymoose.edsl.tracer import clear_compile_cache
 from pymoose.edsl.tracer import trace
 from pymoose.edsl.tracer import trace_and_compile
 from pymoose.pymoose import elk_compiler
@@ -81,6 +82,7 @@ __all__ = [
     Argument,
     bool_,
     cast,
+    clear_compile_cache,
     computation,
     concatenate,
     constant,
@@ -1,10 +1,10 @@
+import contextvars
 import functools as ft
 import inspect
+import weakref
 from dataclasses import dataclass
 from typing import List
 from typing import Optional
-from typing import Tuple
-from typing import Union
 
 import numpy as np
 
@@ -12,12 +12,9 @@ from pymoose.computation import dtypes
 from pymoose.computation import types as ty
 from pymoose.computation import values
 
-try:  # post python 3.10
-    from types import EllipsisType
-except ImportError:
-    EllipsisType = type(...)
-
-CURRENT_PLACEMENT: List = []
+# stack of active placement contexts; a context variable keeps graph construction
+# in separate threads or asyncio tasks from seeing each other's placements
+_PLACEMENT_STACK = contextvars.ContextVar("placement_stack", default=())
 
 _NUMPY_DTYPES_MAP = {
     np.uint32: dtypes.uint32,
@@ -36,6 +33,36 @@ _NUMPY_DTYPES_MAP = {
     np.dtype("bool_"): dtypes.bool_,
 }
 
+
+def _build_numpy_dtypes_table():
+    # numpy numbers its builtin dtypes with small integers, so a flat list indexed
+    # by `np.dtype.num` resolves ndarray dtypes without hashing type objects
+    dtype_nums = {
+        np.dtype(np_dtype).num: dtype for np_dtype, dtype in _NUMPY_DTYPES_MAP.items()
+    }
+    table = [None] * (max(dtype_nums) + 1)
+    for dtype_num, dtype in dtype_nums.items():
+        table[dtype_num] = dtype
+    return table
+
+
+_NUMPY_DTYPES_BY_NUM = _build_numpy_dtypes_table()
+
+
+@ft.lru_cache(maxsize=None)
+def _tensor_type(dtype):
+    # vtypes are never mutated once built, so a single TensorType per dtype can be
+    # shared by every expression; this also turns most vtype comparisons into
+    # identity checks
+    return ty.TensorType(dtype)
+
+
+_BOOL_TENSOR_TYPE = _tensor_type(dtypes.bool_)
+_SHAPE_TYPE = ty.ShapeType()
+_STRING_TYPE = ty.StringType()
+_FLOAT_TYPE = ty.FloatType()
+_INT_TYPE = ty.IntType()
+
 _CURRENT_RUNTIME = None
 
 
@@ -49,56 +76,79 @@ def set_current_runtime(runtime):
     _CURRENT_RUNTIME = runtime
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlacementExpression:
     name: str
 
+    def __post_init__(self):
+        # placements are used as dict keys throughout tracing and compilation,
+        # so the hash of their name is computed once up front; placements are
+        # frozen since interning shares one instance between all callers
+        object.__setattr__(self, "_hash", hash(self.name))
+
     def __enter__(self):
-        global CURRENT_PLACEMENT
-        CURRENT_PLACEMENT.append(self)
+        _PLACEMENT_STACK.set(_PLACEMENT_STACK.get() + (self,))
 
     def __exit__(self, type, value, traceback):
-        global CURRENT_PLACEMENT
-        CURRENT_PLACEMENT.pop(-1)
+        _PLACEMENT_STACK.set(_PLACEMENT_STACK.get()[:-1])
 
 
-@dataclass
+@dataclass(frozen=True)
 class HostPlacementExpression(PlacementExpression):
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
 
-@dataclass
+@dataclass(frozen=True)
 class MirroredPlacementExpression(PlacementExpression):
     players: List[PlacementExpression]
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
 
-@dataclass
+@dataclass(frozen=True)
 class ReplicatedPlacementExpression(PlacementExpression):
     players: List[PlacementExpression]
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
+
+
+# placements built through the factories below are interned, so that repeated
+# declarations of the same placement resolve to the same object and placement
+# comparisons in dicts and sets mostly short-circuit on identity
+_PLACEMENTS = weakref.WeakValueDictionary()
+
+
+def _intern_placement(plc_type, name, players=None):
+    key = (plc_type, name, None if players is None else tuple(players))
+    plc = _PLACEMENTS.get(key)
+    if plc is None:
+        if players is None:
+            plc = plc_type(name=name)
+        else:
+            # copy so later changes to the caller's list can't leak into the
+            # shared instance
+            plc = plc_type(name=name, players=list(players))
+        _PLACEMENTS[key] = plc
+    return plc
 
 
 def host_placement(name):
-    return HostPlacementExpression(name=name)
+    return _intern_placement(HostPlacementExpression, name)
 
 
 def mirrored_placement(name, players):
-    return MirroredPlacementExpression(name=name, players=players)
+    return _intern_placement(MirroredPlacementExpression, name, players)
 
 
 def replicated_placement(name, players):
-    return ReplicatedPlacementExpression(name=name, players=players)
+    return _intern_placement(ReplicatedPlacementExpression, name, players)
 
 
 def get_current_placement():
-    global CURRENT_PLACEMENT
-    return CURRENT_PLACEMENT[-1]
+    return _PLACEMENT_STACK.get()[-1]
 
 
 @dataclass(init=False)
@@ -113,60 +163,37 @@ class Argument:
         self.vtype = _maybe_lift_dtype_to_tensor_vtype(dtype, vtype)
 
 
-@dataclass
 class Expression:
-    placement: PlacementExpression
-    inputs: List["Expression"]
-    vtype: Optional[ty.ValueType]
+    __slots__ = ("placement", "inputs", "vtype", "__weakref__")
 
-    def __hash__(self):
-        return id(self)
+    # expressions are graph nodes and compare by identity; tracing and compiler
+    # passes key dicts on them, so keep the C-level identity hash explicitly
+    __hash__ = object.__hash__
+
+    def __init__(self, placement, inputs, vtype):
+        self.placement = placement
+        self.inputs = inputs
+        self.vtype = vtype
+
+    def __repr__(self):
+        slot_names = [
+            slot_name
+            for cls in reversed(type(self).__mro__)
+            for slot_name in getattr(cls, "__slots__", ())
+            if slot_name != "__weakref__"
+        ]
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in slot_names)
+        return f"{type(self).__name__}({fields})"
 
     # slicing sugar
     def __getitem__(self, slice_spec):
         # TODO explicitly construe placement from
         # global placement context and/or self.placement?
-        assert isinstance(self.vtype, (ty.TensorType, ty.ShapeType, ty.AesTensorType))
-        assert isinstance(slice_spec, (slice, EllipsisType, list, tuple))
-        if isinstance(self.vtype, (ty.TensorType, ty.AesTensorType)):
-
-            # turn single entry to a list of entries
-            if isinstance(slice_spec, (slice, EllipsisType)):
-                slice_spec = (slice_spec,)
-
-            assert isinstance(slice_spec, (list, tuple))
-            slice_rewrite = []
-            for cur_slice in slice_spec:
-                assert isinstance(cur_slice, (slice, EllipsisType))
-                if isinstance(cur_slice, EllipsisType):
-                    slice_rewrite.append(slice(None, None, None))
-                elif isinstance(cur_slice, slice):
-                    slice_rewrite.append(cur_slice)
-                else:
-                    raise ValueError(
-                        "Indexing with other types different than Ellipsis and slice "
-                        "is not yet supported."
-                    )
-            return strided_slice(self, slices=slice_rewrite)
-        elif isinstance(self.vtype, ty.ShapeType):
-            if isinstance(slice_spec, (tuple, list)):
-                if len(slice_spec) > 2:
-                    raise ValueError(
-                        "Indexing ShapeType requires a simple slice, including only "
-                        "`start` & `stop` slice values."
-                    )
-                begin, end = slice_spec
-                assert isinstance(begin, int) and isinstance(end, int)
-            elif isinstance(slice_spec, slice):
-                if slice_spec.step is not None:
-                    raise ValueError(
-                        "Indexing ShapeType requires a simple slice, including only "
-                        "`start` & `stop` slice values."
-                    )
-                begin, end = slice_spec.start, slice_spec.stop
-            return sliced(self, begin, end)
-        else:
+        assert slice_spec is Ellipsis or isinstance(slice_spec, (slice, list, tuple))
+        slice_fn = _SLICE_DISPATCH.get(type(self.vtype))
+        if slice_fn is None:
             raise IndexError(f"Expression of vtype {self.vtype} is not slice-able.")
+        return slice_fn(self, slice_spec)
 
     # arithmetic sugar
     def __neg__(self):
@@ -176,8 +203,12 @@ class Expression:
                 raise TypeError(
                     f"Cannot negate Tensor of unsigned DType {self.vtype.dtype}."
                 )
-        negative_one = constant(-1, vtype=self.vtype)
-        return self.__rmul__(negative_one)
+        # NOTE moose has no logical negation kernel yet, so negation lowers to a
+        # multiplication by -1; `self` was already checked above, so call `mul`
+        # directly rather than re-dispatching through `__rmul__`
+        placement = _materialize_placement_arg(None)
+        negative_one = _scalar_constant(-1, self.vtype, placement)
+        return mul(negative_one, self, placement=placement)
 
     def __abs__(self):
         _check_arithmetickable(self, "abs")
@@ -244,370 +275,315 @@ def _binary_dunder_method(x, y, fn, fn_desc):
     return fn(x, y)
 
 
+# none of these vtypes are subclassed, so an exact type lookup is enough
+_ARITH_VTYPES = frozenset({ty.TensorType, ty.FloatType, ty.IntType})
+
+
 def _check_arithmetickable(expr, fn_name):
-    if not isinstance(expr.vtype, (ty.TensorType, ty.FloatType, ty.IntType)):
+    if type(expr.vtype) not in _ARITH_VTYPES:
         raise TypeError(f"Value of vtype {expr.vtype} is not {fn_name}-able.")
 
 
-@dataclass
+def _tensor_slice(x, slice_spec):
+    # single slices are by far the most common case, skip the rewrite loop for them
+    # slice cannot be subclassed and Ellipsis is a singleton, so plain type and
+    # identity checks suffice here
+    if type(slice_spec) is slice:
+        return strided_slice(x, slices=[slice_spec])
+
+    # turn single entry to a list of entries
+    if slice_spec is Ellipsis:
+        slice_spec = (slice_spec,)
+
+    slice_rewrite = []
+    for cur_slice in slice_spec:
+        if cur_slice is Ellipsis:
+            slice_rewrite.append(slice(None, None, None))
+        elif type(cur_slice) is slice:
+            slice_rewrite.append(cur_slice)
+        else:
+            raise ValueError(
+                "Indexing with other types different than Ellipsis and slice "
+                "is not yet supported."
+            )
+    return strided_slice(x, slices=slice_rewrite)
+
+
+def _shape_slice(x, slice_spec):
+    if isinstance(slice_spec, (tuple, list)):
+        if len(slice_spec) > 2:
+            raise ValueError(
+                "Indexing ShapeType requires a simple slice, including only "
+                "`start` & `stop` slice values."
+            )
+        begin, end = slice_spec
+        assert isinstance(begin, int) and isinstance(end, int)
+    elif isinstance(slice_spec, slice) and slice_spec.step is None:
+        begin, end = slice_spec.start, slice_spec.stop
+    else:
+        raise ValueError(
+            "Indexing ShapeType requires a simple slice, including only "
+            "`start` & `stop` slice values."
+        )
+    return sliced(x, begin, end)
+
+
+_SLICE_DISPATCH = {
+    ty.TensorType: _tensor_slice,
+    ty.AesTensorType: _tensor_slice,
+    ty.ShapeType: _shape_slice,
+}
+
+
 class AddNExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class IdentityExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class ArgumentExpression(Expression):
-    arg_name: str
+    __slots__ = ("arg_name",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, arg_name):
+        super().__init__(placement, inputs, vtype)
+        self.arg_name = arg_name
 
 
-@dataclass
 class ConcatenateExpression(Expression):
-    axis: Optional[int]
+    __slots__ = ("axis",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, axis):
+        super().__init__(placement, inputs, vtype)
+        self.axis = axis
 
 
-@dataclass
 class MaximumExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class DecryptExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class ConstantExpression(Expression):
-    value: Union[int, float]
+    __slots__ = ("value",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, value):
+        super().__init__(placement, inputs, vtype)
+        self.value = value
 
 
-@dataclass
 class BinaryOpExpression(Expression):
-    op_name: str
+    __slots__ = ("op_name",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, op_name):
+        super().__init__(placement, inputs, vtype)
+        self.op_name = op_name
 
 
-@dataclass
 class ExpandDimsExpression(Expression):
-    axis: Tuple[int]
+    __slots__ = ("axis",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, axis):
+        super().__init__(placement, inputs, vtype)
+        self.axis = axis
 
 
-@dataclass
 class SqueezeExpression(Expression):
-    axis: Optional[Union[int, Tuple[int]]]
+    __slots__ = ("axis",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, axis):
+        super().__init__(placement, inputs, vtype)
+        self.axis = axis
 
 
-@dataclass
 class OnesExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class ZerosExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class SquareExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class SumExpression(Expression):
-    axis: Optional[Union[int, Tuple[int]]]
+    __slots__ = ("axis",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, axis):
+        super().__init__(placement, inputs, vtype)
+        self.axis = axis
 
 
-@dataclass
 class MeanExpression(Expression):
-    axis: Optional[Union[int, Tuple[int]]]
+    __slots__ = ("axis",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, axis):
+        super().__init__(placement, inputs, vtype)
+        self.axis = axis
 
 
-@dataclass
 class ExpExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class SigmoidExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class SoftmaxExpression(Expression):
-    axis: Optional[Union[int, Tuple[int]]]
-    upmost_index: int
+    __slots__ = ("axis", "upmost_index")
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, axis, upmost_index):
+        super().__init__(placement, inputs, vtype)
+        self.axis = axis
+        self.upmost_index = upmost_index
 
 
-@dataclass
 class ReluExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class ArgmaxExpression(Expression):
-    axis: Optional[Union[int, Tuple[int]]]
-    upmost_index: int
+    __slots__ = ("axis", "upmost_index")
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, axis, upmost_index):
+        super().__init__(placement, inputs, vtype)
+        self.axis = axis
+        self.upmost_index = upmost_index
 
 
-@dataclass
 class LogExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class Log2Expression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class SqrtExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class TransposeExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class ReshapeExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class AtLeast2DExpression(Expression):
-    to_column_vector: bool
+    __slots__ = ("to_column_vector",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, to_column_vector):
+        super().__init__(placement, inputs, vtype)
+        self.to_column_vector = to_column_vector
 
 
-@dataclass
 class LoadExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class InverseExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class AbsExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class CastExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class SaveExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class ShapeExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class IndexAxisExpression(Expression):
-    axis: int
-    index: int
+    __slots__ = ("axis", "index")
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, axis, index):
+        super().__init__(placement, inputs, vtype)
+        self.axis = axis
+        self.index = index
 
 
-@dataclass
 class SliceExpression(Expression):
-    begin: int
-    end: int
+    __slots__ = ("begin", "end")
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, begin, end):
+        super().__init__(placement, inputs, vtype)
+        self.begin = begin
+        self.end = end
 
 
-@dataclass
 class StridedSliceExpression(Expression):
-    slices: Optional[Tuple[slice]]
+    __slots__ = ("slices",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, slices):
+        super().__init__(placement, inputs, vtype)
+        self.slices = slices
 
 
-@dataclass
 class LessExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class GreaterExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class BitwiseOrExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class MuxExpression(Expression):
-    def __hash__(self):
-        return id(self)
+    __slots__ = ()
 
 
-@dataclass
 class OutputExpression(Expression):
-    tag: str
+    __slots__ = ("tag",)
 
-    def __hash__(self):
-        return id(self)
+    def __init__(self, placement, inputs, vtype, tag):
+        super().__init__(placement, inputs, vtype)
+        self.tag = tag
 
 
 def add_n(arrays, placement=None):
     placement = _materialize_placement_arg(placement)
-    if not isinstance(arrays, (tuple, list)):
-        raise ValueError(
-            "Inputs to `add_n` must be array-like, found argument "
-            f"of type {type(arrays)}."
-        )
-    input_vtype = arrays[0].vtype
-    if isinstance(input_vtype, ty.TensorType):
-        expected_vtype = input_vtype
-        expected_dtype = input_vtype.dtype
-    else:
-        raise ValueError(f"Inputs must be have vtype TensorType, found {input_vtype}.")
-    for array in arrays:
-        if array.vtype != expected_vtype:
-            raise ValueError(
-                f"Inputs must be have vtype TensorType, found {array.vtype}."
-            )
-        if array.vtype.dtype != expected_dtype:
-            raise ValueError(
-                f"Values passed to add_n must be same dtype: found {array.dtype} "
-                f"and {expected_dtype} in value of `arrays` argument."
-            )
-    return AddNExpression(placement=placement, inputs=arrays, vtype=input_vtype)
+    input_vtype = _assimilate_array_vtypes(arrays, "add_n")
+    return AddNExpression(placement=placement, inputs=tuple(arrays), vtype=input_vtype)
 
 
 def identity(x, placement=None):
     placement = _materialize_placement_arg(placement)
-    return IdentityExpression(placement=placement, inputs=[x], vtype=x.vtype)
+    return IdentityExpression(placement=placement, inputs=(x,), vtype=x.vtype)
 
 
 def concatenate(arrays, axis=0, placement=None):
     placement = _materialize_placement_arg(placement)
-    if not isinstance(arrays, (tuple, list)):
-        raise ValueError(
-            "Inputs to `concatenate` must be array-like, found argument "
-            f"of type {type(arrays)}."
-        )
-    input_vtype = arrays[0].vtype
-    if isinstance(input_vtype, ty.TensorType):
-        expected_vtype = input_vtype
-        expected_dtype = input_vtype.dtype
-    else:
-        raise ValueError(f"Inputs must be have vtype TensorType, found {input_vtype}.")
-
-    for array in arrays:
-        if array.vtype != expected_vtype:
-            raise ValueError(
-                f"Inputs must be have vtype TensorType, found {array.vtype}."
-            )
-        if array.vtype.dtype != expected_dtype:
-            raise ValueError(
-                f"Values passed to concatenate must be same dtype: found {array.dtype} "
-                f"and {expected_dtype} in value of `arrays` argument."
-            )
+    input_vtype = _assimilate_array_vtypes(arrays, "concatenate")
     return ConcatenateExpression(
-        placement=placement, inputs=arrays, axis=axis, vtype=input_vtype
+        placement=placement, inputs=tuple(arrays), axis=axis, vtype=input_vtype
     )
 
 
 def maximum(arrays, placement=None):
     placement = _materialize_placement_arg(placement)
-    if not isinstance(arrays, (tuple, list)):
-        raise ValueError(
-            "Inputs to `concatenate` must be array-like, found argument "
-            f"of type {type(arrays)}."
-        )
-    input_vtype = arrays[0].vtype
-    if isinstance(input_vtype, ty.TensorType):
-        expected_vtype = input_vtype
-        expected_dtype = input_vtype.dtype
-    else:
-        raise ValueError(f"Inputs must be have vtype TensorType, found {input_vtype}.")
-
-    for array in arrays:
-        if array.vtype != expected_vtype:
-            raise ValueError(
-                f"Inputs must be have vtype TensorType, found {array.vtype}."
-            )
-        if array.vtype.dtype != expected_dtype:
-            raise ValueError(
-                f"Values passed to maximum must be same dtype: found {array.dtype} "
-                f"and {expected_dtype} in value of `arrays` argument."
-            )
-    return MaximumExpression(placement=placement, inputs=arrays, vtype=input_vtype)
+    input_vtype = _assimilate_array_vtypes(arrays, "maximum")
+    return MaximumExpression(
+        placement=placement, inputs=tuple(arrays), vtype=input_vtype
+    )
 
 
 def decrypt(key, ciphertext, placement=None):
@@ -627,11 +603,11 @@ def decrypt(key, ciphertext, placement=None):
         )
     # decrypt converts AesTensorType(fixed(i, f)) -> TensorType(fixed(i, f))
     output_dtype = ciphertext.vtype.dtype
-    output_type = ty.TensorType(output_dtype)
+    output_type = _tensor_type(output_dtype)
 
     return DecryptExpression(
         placement=placement,
-        inputs=[key, ciphertext],
+        inputs=(key, ciphertext),
         vtype=output_type,
     )
 
@@ -641,7 +617,12 @@ def constant(value, dtype=None, vtype=None, placement=None):
     vtype = _maybe_lift_dtype_to_tensor_vtype(dtype, vtype)
 
     if isinstance(value, np.ndarray):
-        moose_dtype = _NUMPY_DTYPES_MAP.get(value.dtype.type, None)
+        dtype_num = value.dtype.num
+        moose_dtype = (
+            _NUMPY_DTYPES_BY_NUM[dtype_num]
+            if dtype_num < len(_NUMPY_DTYPES_BY_NUM)
+            else None
+        )
         if moose_dtype is None:
             raise NotImplementedError(
                 f"Tensors of dtype `{value.dtype}` not supported as graph constants."
@@ -656,20 +637,20 @@ def constant(value, dtype=None, vtype=None, placement=None):
             implicit_const = constant(value, dtype=moose_dtype, placement=placement)
             return cast(implicit_const, dtype, placement)
         elif vtype is None:
-            vtype = ty.TensorType(moose_dtype)
+            vtype = _tensor_type(moose_dtype)
         value = values.TensorConstant(value=value)
     elif isinstance(value, float):
         if isinstance(vtype, ty.TensorType) and vtype.dtype.is_fixedpoint:
             # want to use implicit casting, so simply wrap as ndarray and recurse
             return constant(np.array(value), vtype=vtype)
-        value, vtype = _interpret_numeric_value(value, vtype, ty.FloatType())
+        value, vtype = _interpret_numeric_value(value, vtype, _FLOAT_TYPE)
     elif isinstance(value, int):
         if isinstance(vtype, ty.TensorType) and vtype.dtype.is_fixedpoint:
             # want to use implicit casting, so simply wrap as ndarray and recurse
             return constant(np.array(value), vtype=vtype)
-        value, vtype = _interpret_numeric_value(value, vtype, ty.IntType())
+        value, vtype = _interpret_numeric_value(value, vtype, _INT_TYPE)
     elif isinstance(value, str):
-        vtype = vtype or ty.StringType()
+        vtype = vtype or _STRING_TYPE
         if not isinstance(vtype, ty.StringType):
             raise ValueError(
                 "Constant value of type `str` does not match "
@@ -677,7 +658,7 @@ def constant(value, dtype=None, vtype=None, placement=None):
             )
         value = values.StringConstant(value=value)
 
-    return ConstantExpression(placement=placement, inputs=[], value=value, vtype=vtype)
+    return ConstantExpression(placement=placement, inputs=(), value=value, vtype=vtype)
 
 
 def add(lhs, rhs, placement=None):
@@ -686,7 +667,7 @@ def add(lhs, rhs, placement=None):
     placement = _materialize_placement_arg(placement)
     vtype = _assimilate_arg_vtypes(lhs.vtype, rhs.vtype, "add")
     return BinaryOpExpression(
-        op_name="add", placement=placement, inputs=[lhs, rhs], vtype=vtype
+        op_name="add", placement=placement, inputs=(lhs, rhs), vtype=vtype
     )
 
 
@@ -696,7 +677,7 @@ def sub(lhs, rhs, placement=None):
     placement = _materialize_placement_arg(placement)
     vtype = _assimilate_arg_vtypes(lhs.vtype, rhs.vtype, "sub")
     return BinaryOpExpression(
-        op_name="sub", placement=placement, inputs=[lhs, rhs], vtype=vtype
+        op_name="sub", placement=placement, inputs=(lhs, rhs), vtype=vtype
     )
 
 
@@ -706,7 +687,7 @@ def mul(lhs, rhs, placement=None):
     placement = _materialize_placement_arg(placement)
     vtype = _assimilate_arg_vtypes(lhs.vtype, rhs.vtype, "mul")
     return BinaryOpExpression(
-        op_name="mul", placement=placement, inputs=[lhs, rhs], vtype=vtype
+        op_name="mul", placement=placement, inputs=(lhs, rhs), vtype=vtype
     )
 
 
@@ -716,7 +697,7 @@ def dot(lhs, rhs, placement=None):
     placement = _materialize_placement_arg(placement)
     vtype = _assimilate_arg_vtypes(lhs.vtype, rhs.vtype, "dot")
     return BinaryOpExpression(
-        op_name="dot", placement=placement, inputs=[lhs, rhs], vtype=vtype
+        op_name="dot", placement=placement, inputs=(lhs, rhs), vtype=vtype
     )
 
 
@@ -726,7 +707,7 @@ def div(lhs, rhs, placement=None):
     placement = _materialize_placement_arg(placement)
     vtype = _assimilate_arg_vtypes(lhs.vtype, rhs.vtype, "div")
     return BinaryOpExpression(
-        op_name="div", placement=placement, inputs=[lhs, rhs], vtype=vtype
+        op_name="div", placement=placement, inputs=(lhs, rhs), vtype=vtype
     )
 
 
@@ -737,8 +718,8 @@ def less(lhs, rhs, placement=None):
     return BinaryOpExpression(
         op_name="less",
         placement=placement,
-        inputs=[lhs, rhs],
-        vtype=ty.TensorType(dtype=dtypes.bool_),
+        inputs=(lhs, rhs),
+        vtype=_BOOL_TENSOR_TYPE,
     )
 
 
@@ -749,8 +730,8 @@ def greater(lhs, rhs, placement=None):
     return BinaryOpExpression(
         op_name="greater",
         placement=placement,
-        inputs=[lhs, rhs],
-        vtype=ty.TensorType(dtype=dtypes.bool_),
+        inputs=(lhs, rhs),
+        vtype=_BOOL_TENSOR_TYPE,
     )
 
 
@@ -760,7 +741,7 @@ def logical_or(lhs, rhs, placement=None):
     placement = _materialize_placement_arg(placement)
     vtype = _assimilate_arg_vtypes(lhs.vtype, rhs.vtype, "or")
     return BinaryOpExpression(
-        op_name="or", placement=placement, inputs=[lhs, rhs], vtype=vtype
+        op_name="or", placement=placement, inputs=(lhs, rhs), vtype=vtype
     )
 
 
@@ -777,7 +758,7 @@ def inverse(x, placement=None):
             "`inverse` operation only supports arguments of dtype `float32` or "
             "`float64`."
         )
-    return InverseExpression(placement=placement, inputs=[x], vtype=vtype)
+    return InverseExpression(placement=placement, inputs=(x,), vtype=vtype)
 
 
 def expand_dims(x, axis, placement=None):
@@ -793,56 +774,34 @@ def expand_dims(x, axis, placement=None):
         axis = [axis]
     placement = _materialize_placement_arg(placement)
     return ExpandDimsExpression(
-        placement=placement, inputs=[x], axis=axis, vtype=x.vtype
+        placement=placement, inputs=(x,), axis=axis, vtype=x.vtype
     )
 
 
 def squeeze(x, axis=None, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return SqueezeExpression(placement=placement, inputs=[x], axis=axis, vtype=x.vtype)
+    return SqueezeExpression(placement=placement, inputs=(x,), axis=axis, vtype=x.vtype)
 
 
 def ones(shape, dtype, placement=None):
     assert isinstance(shape, Expression)
     placement = _materialize_placement_arg(placement)
     if isinstance(shape, (list, tuple)):
-        # TODO (Yann) Currently we only have the ability to declare HostShape
-        # as constant. We should add the ability to declare RepShape as constant.
-        if isinstance(placement, ReplicatedPlacementExpression):
-            host_placement = placement.players[0]
-        else:
-            host_placement = placement
-
-        shape = constant(
-            values.ShapeConstant(value=shape),
-            vtype=ty.ShapeType(),
-            placement=host_placement,
-        )
+        shape = _shape_constant(shape, placement)
 
-    vtype = ty.TensorType(dtype)
-    return OnesExpression(placement=placement, inputs=[shape], vtype=vtype)
+    vtype = _tensor_type(dtype)
+    return OnesExpression(placement=placement, inputs=(shape,), vtype=vtype)
 
 
 def zeros(shape, dtype, placement=None):
     assert isinstance(shape, Expression)
     placement = _materialize_placement_arg(placement)
     if isinstance(shape, (list, tuple)):
-        # TODO (Yann) Currently we only have the ability to declare HostShape
-        # as constant. We should add the ability to declare RepShape as constant.
-        if isinstance(placement, ReplicatedPlacementExpression):
-            host_placement = placement.players[0]
-        else:
-            host_placement = placement
+        shape = _shape_constant(shape, placement)
 
-        shape = constant(
-            values.ShapeConstant(value=shape),
-            vtype=ty.ShapeType(),
-            placement=host_placement,
-        )
-
-    vtype = ty.TensorType(dtype)
-    return ZerosExpression(placement=placement, inputs=[shape], vtype=vtype)
+    vtype = _tensor_type(dtype)
+    return ZerosExpression(placement=placement, inputs=(shape,), vtype=vtype)
 
 
 def square(x, placement=None):
@@ -854,37 +813,37 @@ def square(x, placement=None):
 def sum(x, axis=None, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return SumExpression(placement=placement, inputs=[x], axis=axis, vtype=x.vtype)
+    return SumExpression(placement=placement, inputs=(x,), axis=axis, vtype=x.vtype)
 
 
 def mean(x, axis=None, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return MeanExpression(placement=placement, inputs=[x], axis=axis, vtype=x.vtype)
+    return MeanExpression(placement=placement, inputs=(x,), axis=axis, vtype=x.vtype)
 
 
 def exp(x, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return ExpExpression(placement=placement, inputs=[x], vtype=x.vtype)
+    return ExpExpression(placement=placement, inputs=(x,), vtype=x.vtype)
 
 
 def sqrt(x, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return SqrtExpression(placement=placement, inputs=[x], vtype=x.vtype)
+    return SqrtExpression(placement=placement, inputs=(x,), vtype=x.vtype)
 
 
 def sigmoid(x, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return SigmoidExpression(placement=placement, inputs=[x], vtype=x.vtype)
+    return SigmoidExpression(placement=placement, inputs=(x,), vtype=x.vtype)
 
 
 def relu(x, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return ReluExpression(placement=placement, inputs=[x], vtype=x.vtype)
+    return ReluExpression(placement=placement, inputs=(x,), vtype=x.vtype)
 
 
 def softmax(x, axis, upmost_index, placement=None):
@@ -892,7 +851,7 @@ def softmax(x, axis, upmost_index, placement=None):
     placement = _materialize_placement_arg(placement)
     return SoftmaxExpression(
         placement=placement,
-        inputs=[x],
+        inputs=(x,),
         axis=axis,
         upmost_index=upmost_index,
         vtype=x.vtype,
@@ -904,7 +863,7 @@ def argmax(x, axis, upmost_index, placement=None):
     placement = _materialize_placement_arg(placement)
     return ArgmaxExpression(
         placement=placement,
-        inputs=[x],
+        inputs=(x,),
         axis=axis,
         upmost_index=upmost_index,
         vtype=x.vtype,
@@ -916,7 +875,7 @@ def log(x, placement=None):
     placement = _materialize_placement_arg(placement)
     return LogExpression(
         placement=placement,
-        inputs=[x],
+        inputs=(x,),
         vtype=x.vtype,
     )
 
@@ -924,13 +883,13 @@ def log(x, placement=None):
 def log2(x, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return Log2Expression(placement=placement, inputs=[x], vtype=x.vtype)
+    return Log2Expression(placement=placement, inputs=(x,), vtype=x.vtype)
 
 
 def shape(x, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return ShapeExpression(placement=placement, inputs=[x], vtype=ty.ShapeType())
+    return ShapeExpression(placement=placement, inputs=(x,), vtype=_SHAPE_TYPE)
 
 
 def index_axis(x, axis, index, placement=None):
@@ -948,7 +907,7 @@ def index_axis(x, axis, index, placement=None):
 
     placement = _materialize_placement_arg(placement)
     return IndexAxisExpression(
-        placement=placement, inputs=[x], axis=axis, index=index, vtype=x.vtype
+        placement=placement, inputs=(x,), axis=axis, index=index, vtype=x.vtype
     )
 
 
@@ -958,7 +917,7 @@ def sliced(x, begin, end, placement=None):
     assert isinstance(end, int)
     placement = _materialize_placement_arg(placement)
     return SliceExpression(
-        placement=placement, inputs=[x], begin=begin, end=end, vtype=x.vtype
+        placement=placement, inputs=(x,), begin=begin, end=end, vtype=x.vtype
     )
 
 
@@ -972,14 +931,14 @@ def strided_slice(x, slices, placement=None):
                 "`slices` argument must a list/tuple of slices, found " f"{type(s)}"
             )
     return StridedSliceExpression(
-        placement=placement, inputs=[x], slices=slices, vtype=x.vtype
+        placement=placement, inputs=(x,), slices=slices, vtype=x.vtype
     )
 
 
 def transpose(x, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return TransposeExpression(placement=placement, inputs=[x], vtype=x.vtype)
+    return TransposeExpression(placement=placement, inputs=(x,), vtype=x.vtype)
 
 
 def atleast_2d(x, to_column_vector=False, placement=None):
@@ -987,7 +946,7 @@ def atleast_2d(x, to_column_vector=False, placement=None):
     placement = _materialize_placement_arg(placement)
     return AtLeast2DExpression(
         placement=placement,
-        inputs=[x],
+        inputs=(x,),
         to_column_vector=to_column_vector,
         vtype=x.vtype,
     )
@@ -997,27 +956,16 @@ def reshape(x, shape, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
     if isinstance(shape, (list, tuple)):
-        # TODO (Yann) Currently we only have the ability to declare HostShape
-        # as constant. We should add the ability to declare RepShape as constant.
-        if isinstance(placement, ReplicatedPlacementExpression):
-            host_placement = placement.players[0]
-        else:
-            host_placement = placement
-
-        shape = constant(
-            values.ShapeConstant(value=shape),
-            vtype=ty.ShapeType(),
-            placement=host_placement,
-        )
+        shape = _shape_constant(shape, placement)
 
     assert isinstance(shape, Expression)
-    return ReshapeExpression(placement=placement, inputs=[x, shape], vtype=x.vtype)
+    return ReshapeExpression(placement=placement, inputs=(x, shape), vtype=x.vtype)
 
 
 def abs(x, placement=None):
     assert isinstance(x, Expression)
     placement = _materialize_placement_arg(placement)
-    return AbsExpression(placement=placement, inputs=[x], vtype=x.vtype)
+    return AbsExpression(placement=placement, inputs=(x,), vtype=x.vtype)
 
 
 def mux(selector, x, y, placement=None):
@@ -1033,7 +981,7 @@ def mux(selector, x, y, placement=None):
     placement = _materialize_placement_arg(placement)
     assert isinstance(placement, ReplicatedPlacementExpression)
     vtype = _assimilate_arg_vtypes(x.vtype, y.vtype, "mux")
-    return MuxExpression(placement=placement, inputs=[selector, x, y], vtype=vtype)
+    return MuxExpression(placement=placement, inputs=(selector, x, y), vtype=vtype)
 
 
 def cast(x, dtype, placement=None):
@@ -1058,72 +1006,61 @@ def cast(x, dtype, placement=None):
 
     # Ensure value can be cast by compiler/executor into the well-defined dtype arg
     if isinstance(dtype, dtypes.DType):
+        if x.vtype.dtype == dtype:
+            # This is a no-op
+            return x
         moose_dtype = dtype
-    elif dtype in _NUMPY_DTYPES_MAP:
-        moose_dtype = _NUMPY_DTYPES_MAP[dtype]
     else:
-        raise ValueError(
-            "Unsupported dtype arg in `cast` function: expected argument "
-            f"of type DType, found type {type(dtype)}."
-        )
-
-    if x.vtype.dtype == moose_dtype:
-        # This is a no-op
-        return x
+        moose_dtype = _NUMPY_DTYPES_MAP.get(dtype)
+        if moose_dtype is None:
+            raise ValueError(
+                "Unsupported dtype arg in `cast` function: expected argument "
+                f"of type DType, found type {type(dtype)}."
+            )
+        if x.vtype.dtype == moose_dtype:
+            # This is a no-op
+            return x
 
     return CastExpression(
-        placement=placement, inputs=[x], vtype=ty.TensorType(moose_dtype)
+        placement=placement, inputs=(x,), vtype=_tensor_type(moose_dtype)
+    )
+
+
+def _coerce_string_expr(val, fn_name, arg_name, placement):
+    # exact type checks first for the two common cases, then the general ones
+    val_type = type(val)
+    if val_type is str:
+        return constant(val, placement=placement, vtype=_STRING_TYPE)
+    if isinstance(val, Expression):
+        return val
+    if isinstance(val, str):
+        return constant(val, placement=placement, vtype=_STRING_TYPE)
+    if val_type is Argument:
+        # vtype must be None or StringType; the latter has no fields to compare
+        if val.vtype is not None and type(val.vtype) is not ty.StringType:
+            raise ValueError(
+                f"Function 'edsl.{fn_name}' encountered `{arg_name}` argument of "
+                f"vtype {val.vtype}; expected `StringType`."
+            )
+    raise ValueError(
+        f"Function 'edsl.{fn_name}' encountered `{arg_name}` argument of "
+        f"type {val_type}; expected one of: string, ConstantExpression, or Argument."
     )
 
 
 def load(key, query="", dtype=None, vtype=None, placement=None):
     placement = _materialize_placement_arg(placement)
     vtype = _maybe_lift_dtype_to_tensor_vtype(dtype, vtype)
-    if isinstance(key, str):
-        key = constant(key, placement=placement, vtype=ty.StringType())
-    elif isinstance(key, Argument) and key.vtype not in [ty.StringType(), None]:
-        raise ValueError(
-            f"Function 'edsl.load' encountered `key` argument of vtype {key.vtype}; "
-            "expected `StringType`."
-        )
-    elif not isinstance(key, Expression):
-        raise ValueError(
-            f"Function 'edsl.load' encountered `key` argument of type {type(key)}; "
-            "expected one of: string, ConstantExpression, or Argument."
-        )
-
-    if isinstance(query, str):
-        query = constant(query, placement=placement, vtype=ty.StringType())
-    elif isinstance(query, Argument) and query.vtype not in [ty.StringType(), None]:
-        raise ValueError(
-            f"Function 'edsl.load' encountered `query` argument of "
-            f"vtype {query.vtype}; expected 'StringType'."
-        )
-    elif not isinstance(query, Expression):
-        raise ValueError(
-            f"Function 'edsl.load' encountered `query` argument of type {type(query)}; "
-            "expected one of: string, ConstantExpression, or Argument."
-        )
-
-    return LoadExpression(placement=placement, inputs=[key, query], vtype=vtype)
+    key = _coerce_string_expr(key, "load", "key", placement)
+    query = _coerce_string_expr(query, "load", "query", placement)
+    return LoadExpression(placement=placement, inputs=(key, query), vtype=vtype)
 
 
 def save(key, value, placement=None):
     assert isinstance(value, Expression)
     placement = _materialize_placement_arg(placement)
-    if isinstance(key, str):
-        key = constant(key, placement=placement, vtype=ty.StringType())
-    elif isinstance(key, Argument) and key.vtype not in [ty.StringType(), None]:
-        raise ValueError(
-            f"Function 'edsl.save' encountered `key` argument of type {key.vtype}; "
-            "expected 'StringType'."
-        )
-    elif not isinstance(key, Expression):
-        raise ValueError(
-            f"Function 'edsl.save' encountered `key` argument of type {type(key)}; "
-            "expected one of: string, ConstantExpression, or ArgumentExpression."
-        )
-    return SaveExpression(placement=placement, inputs=[key, value], vtype=None)
+    key = _coerce_string_expr(key, "save", "key", placement)
+    return SaveExpression(placement=placement, inputs=(key, value), vtype=None)
 
 
 def output(tag, value, placement=None):
@@ -1131,13 +1068,13 @@ def output(tag, value, placement=None):
     assert isinstance(tag, str)
     placement = _materialize_placement_arg(placement)
     return OutputExpression(
-        placement=placement, inputs=[value], vtype=value.vtype, tag=tag
+        placement=placement, inputs=(value,), vtype=value.vtype, tag=tag
     )
 
 
 def computation(func=None, role_map=None):
     if func is None:
-        return ft.partial(computation, role_map=role_map)
+        return lambda func: AbstractComputation(func, role_map)
     return AbstractComputation(func, role_map)
 
 
@@ -1148,6 +1085,9 @@ class AbstractComputation:
                 f"Argument `func` should be a callable, but found {type(func)}."
             )
         self.func = func
+        # resolving the signature is slow, so do it once rather than on every call
+        self._arg_names = tuple(inspect.signature(func).parameters)
+        self._arg_name_set = frozenset(self._arg_names)
 
         if role_map is not None and not isinstance(role_map, dict):
             raise TypeError(
@@ -1157,47 +1097,56 @@ class AbstractComputation:
         self.role_map = role_map
 
     def __call__(self, *args, **kwargs):
-        func_signature = inspect.signature(self.func)
-        arg_names = [arg_name for arg_name, _ in func_signature.parameters.items()]
+        if not kwargs and len(args) == len(self._arg_names):
+            # all arguments given positionally, so none can be missing or extra
+            arguments = dict(zip(self._arg_names, args))
+        else:
+            arguments = self._bind_arguments(args, kwargs)
 
-        arguments = {}
+        runtime = get_current_runtime()
+        if not runtime:
+            raise RuntimeError("No default runtime found")
+
+        return runtime.evaluate_computation(self, arguments)
+
+    def _bind_arguments(self, args, kwargs):
+        arg_names = self._arg_names
+        if len(args) > len(arg_names):
+            raise ValueError(f"Too many arguments for `{self.func.__name__}`")
 
         # add values from `args`
-        for arg_i, arg_val in enumerate(args):
-            if arg_i >= len(arg_names):
-                raise ValueError(f"Too many arguments for `{self.func.__name__}`")
-            arg_name = arg_names[arg_i]
-            arguments[arg_name] = arg_val
-
-        # add values from `kwargs`
-        for arg_name, arg_val in kwargs.items():
-            if arg_name in arguments:
-                raise ValueError(
-                    f"Argument `{arg_name}` given more than once to "
-                    f"`{self.func.__name__}`"
-                )
-            arguments[arg_name] = arg_val
+        arguments = dict(zip(arg_names, args))
+
+        # add values from `kwargs`; the set operations below only find out whether
+        # something is wrong, the offending name is then looked up in call order
+        if arguments.keys() & kwargs.keys():
+            arg_name = next(arg_name for arg_name in kwargs if arg_name in arguments)
+            raise ValueError(
+                f"Argument `{arg_name}` given more than once to "
+                f"`{self.func.__name__}`"
+            )
+        arguments.update(kwargs)
 
         # check that all arguments were given
-        for arg_name in arg_names:
-            if arg_name not in arguments:
-                raise ValueError(
-                    f"Missing argument `{arg_name}` in call to `{self.func.__name__}`"
-                )
+        if self._arg_name_set - arguments.keys():
+            arg_name = next(
+                arg_name for arg_name in arg_names if arg_name not in arguments
+            )
+            raise ValueError(
+                f"Missing argument `{arg_name}` in call to `{self.func.__name__}`"
+            )
 
         # check that no extra arguments were given
         # NOTE we could potentially leave out this check
-        for arg_name in arguments.keys():
-            if arg_name not in arg_names:
-                raise ValueError(
-                    f"Argument `{arg_name}` is not used by `{self.func.__name__}`"
-                )
+        if kwargs.keys() - self._arg_name_set:
+            arg_name = next(
+                arg_name for arg_name in kwargs if arg_name not in self._arg_name_set
+            )
+            raise ValueError(
+                f"Argument `{arg_name}` is not used by `{self.func.__name__}`"
+            )
 
-        runtime = get_current_runtime()
-        if not runtime:
-            raise RuntimeError("No default runtime found")
-
-        return runtime.evaluate_computation(self, arguments)
+        return arguments
 
     def with_role_map(self, role_map):
         return self.__class__(self.func, role_map)
@@ -1206,7 +1155,8 @@ class AbstractComputation:
 def _assimilate_arg_dtypes(lhs_vtype, rhs_vtype, fn_name):
     lhs_dtype = lhs_vtype.dtype
     rhs_dtype = rhs_vtype.dtype
-    if lhs_dtype != rhs_dtype:
+    # dtype equality hashes both operands, so settle the common case by identity
+    if lhs_dtype is not rhs_dtype and lhs_dtype != rhs_dtype:
         raise ValueError(
             f"Function `{fn_name}` expected arguments of similar dtype: "
             f"found mismatched dtypes `{lhs_dtype}` and `{rhs_dtype}`."
@@ -1215,6 +1165,9 @@ def _assimilate_arg_dtypes(lhs_vtype, rhs_vtype, fn_name):
 
 
 def _assimilate_arg_vtypes(lhs_vtype, rhs_vtype, fn_name):
+    # most vtypes are interned, in particular both operands of `x op x`
+    if lhs_vtype is rhs_vtype:
+        return lhs_vtype
     if isinstance(lhs_vtype, ty.TensorType) and isinstance(rhs_vtype, ty.TensorType):
         return _assimilate_arg_dtypes(lhs_vtype, rhs_vtype, fn_name)
     if lhs_vtype != rhs_vtype:
@@ -1225,8 +1178,38 @@ def _assimilate_arg_vtypes(lhs_vtype, rhs_vtype, fn_name):
     return lhs_vtype
 
 
+def _assimilate_array_vtypes(arrays, fn_name):
+    if not isinstance(arrays, (tuple, list)):
+        raise ValueError(
+            f"Inputs to `{fn_name}` must be array-like, found argument "
+            f"of type {type(arrays)}."
+        )
+    input_vtype = arrays[0].vtype
+    if not isinstance(input_vtype, ty.TensorType):
+        raise ValueError(f"Inputs must be have vtype TensorType, found {input_vtype}.")
+    # vtypes are mostly interned, so the identity check settles nearly every input
+    mismatched = next(
+        (
+            array
+            for array in arrays
+            if array.vtype is not input_vtype and array.vtype != input_vtype
+        ),
+        None,
+    )
+    if mismatched is not None:
+        raise ValueError(
+            f"Values passed to {fn_name} must be same vtype: found "
+            f"{mismatched.vtype} and {input_vtype} in value of `arrays` argument."
+        )
+    return input_vtype
+
+
 def _check_tensor_type_arg_consistency(dtype, vtype):
-    if isinstance(vtype, ty.TensorType) and vtype.dtype != dtype:
+    if (
+        isinstance(vtype, ty.TensorType)
+        and vtype.dtype is not dtype
+        and vtype.dtype != dtype
+    ):
         raise ValueError(
             f"Inconsistent type information for tensor: dtype {dtype} is "
             f"inconsistent with tensor type {vtype}."
@@ -1234,39 +1217,82 @@ def _check_tensor_type_arg_consistency(dtype, vtype):
 
 
 def _materialize_placement_arg(plc):
-    plc = plc or get_current_placement()
+    if plc is None:
+        # only placement expressions are ever pushed onto the context stack
+        return _PLACEMENT_STACK.get()[-1]
     if not isinstance(plc, PlacementExpression):
         raise TypeError(f"Expected value of type Placement, found {type(plc)}.")
     return plc
 
 
+# shape constants are immutable graph nodes, so identical ones on the same host can be
+# shared for as long as some expression still refers to them
+_SHAPE_CONSTANTS = weakref.WeakValueDictionary()
+
+
+def _shape_constant(shape, placement):
+    # TODO (Yann) Currently we only have the ability to declare HostShape
+    # as constant. We should add the ability to declare RepShape as constant.
+    if isinstance(placement, ReplicatedPlacementExpression):
+        host_placement = placement.players[0]
+    else:
+        host_placement = placement
+
+    shape = tuple(shape)
+    key = (shape, host_placement)
+    shape_const = _SHAPE_CONSTANTS.get(key)
+    if shape_const is None:
+        shape_const = constant(
+            values.ShapeConstant(value=shape),
+            vtype=_SHAPE_TYPE,
+            placement=host_placement,
+        )
+        _SHAPE_CONSTANTS[key] = shape_const
+    return shape_const
+
+
+_SCALAR_CONSTANTS = weakref.WeakValueDictionary()
+
+
+def _scalar_constant(value, vtype, placement):
+    # same sharing as for shape constants; vtypes are not hashable, so key on their
+    # class and dtype instead
+    key = (value, type(vtype), getattr(vtype, "dtype", None), placement)
+    scalar_const = _SCALAR_CONSTANTS.get(key)
+    if scalar_const is None:
+        scalar_const = constant(value, vtype=vtype, placement=placement)
+        _SCALAR_CONSTANTS[key] = scalar_const
+    return scalar_const
+
+
 def _maybe_lift_dtype_to_tensor_vtype(dtype, vtype):
-    if dtype is None and vtype is None:
-        return
-    elif vtype is None and dtype is not None:
-        return ty.TensorType(dtype)
-    elif vtype is not None and dtype is not None:
-        _check_tensor_type_arg_consistency(dtype, vtype)
-        return vtype
-    else:  # vtype but no dtype
+    if dtype is None:  # vtype, if any, is used as is
         return vtype
+    if vtype is None:
+        return _tensor_type(dtype)
+    _check_tensor_type_arg_consistency(dtype, vtype)
+    return vtype
+
+
+_SCALAR_CONSTANT_TYPES = {
+    ty.FloatType: values.FloatConstant,
+    ty.IntType: values.IntConstant,
+}
 
 
 def _interpret_numeric_value(value, vtype, fallback_vtype):
     assert isinstance(value, (int, float))
     if vtype is None:
         vtype = fallback_vtype
-    if isinstance(vtype, ty.TensorType):
-        dtype = vtype.dtype
-        if not dtype.is_float and not dtype.is_integer:
-            raise TypeError(f"Cannot interpret scalar constant as dtype {dtype}.")
-        value = values.TensorConstant(np.array(value, dtype=dtype.numpy_dtype))
-    elif isinstance(vtype, ty.FloatType):
-        value = values.FloatConstant(value)
-    elif isinstance(vtype, ty.IntType):
-        value = values.IntConstant(value)
-    else:
+    constant_type = _SCALAR_CONSTANT_TYPES.get(type(vtype))
+    if constant_type is not None:
+        return constant_type(value), vtype
+    if not isinstance(vtype, ty.TensorType):
         raise TypeError(
-            "Cannot interpret numeric constant as non-numeric type {vtype}."
+            f"Cannot interpret numeric constant as non-numeric type {vtype}."
         )
+    dtype = vtype.dtype
+    if not dtype.is_float and not dtype.is_integer:
+        raise TypeError(f"Cannot interpret scalar constant as dtype {dtype}.")
+    value = values.TensorConstant(np.array(value, dtype=dtype.numpy_dtype))
     return value, vtype
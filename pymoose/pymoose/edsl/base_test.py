@@ -1,3 +1,7 @@
+import collections
+import dataclasses
+import threading
+
 import numpy as np
 from absl.testing import absltest
 from absl.testing import parameterized
@@ -228,6 +232,19 @@ class EdslTest(parameterized.TestCase):
             ),
         )
 
+    def test_dunder_neg_shares_negative_one(self):
+        alice = edsl.host_placement("alice")
+        bob = edsl.host_placement("bob")
+        with alice:
+            x = edsl.constant(np.array([1.0, -2.0, 3.0]))
+            y = edsl.constant(np.array([4.0, 5.0]))
+            neg_x, neg_y = -x, -y
+        with bob:
+            neg_x_on_bob = -x
+        assert neg_x.inputs[0] is neg_y.inputs[0]
+        assert neg_x.inputs[0] is not neg_x_on_bob.inputs[0]
+        assert neg_x_on_bob.inputs[0].placement == bob
+
     def test_identity(self):
         alice = edsl.host_placement("alice")
         bob = edsl.host_placement("bob")
@@ -349,6 +366,37 @@ class EdslTest(parameterized.TestCase):
             ),
         )
 
+    @parameterized.parameters(edsl.add, edsl.sub, edsl.mul, edsl.div, edsl.dot)
+    def test_binary_op_vtype_assimilation(self, binary_op):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(np.array([1.0], dtype=np.float64))
+            x_copy = edsl.constant(np.array([2.0]), vtype=ty.TensorType(dtypes.float64))
+            y = edsl.constant(np.array([1.0], dtype=np.float32))
+            assert binary_op(x, x).vtype is x.vtype
+            assert binary_op(x, x_copy).vtype == x.vtype
+            self.assertRaises(ValueError, binary_op, x, y)
+            self.assertRaises(ValueError, binary_op, edsl.constant(1.0), x)
+
+    @parameterized.parameters(edsl.add_n, edsl.concatenate, edsl.maximum)
+    def test_array_op_mismatched_dtypes(self, array_op):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(np.array([1.0], dtype=np.float64))
+            y = edsl.constant(np.array([1.0], dtype=np.float32))
+            self.assertRaises(ValueError, array_op, [x, x, y])
+            self.assertRaises(ValueError, array_op, x)
+
+    @parameterized.parameters(edsl.add_n, edsl.concatenate, edsl.maximum)
+    def test_array_op_snapshots_inputs(self, array_op):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(np.array([1.0], dtype=np.float64))
+            arrays = [x, x]
+            y = array_op(arrays)
+        arrays.append(x)
+        assert y.inputs == (x, x)
+
     def test_ones(self):
         player0 = edsl.host_placement(name="player0")
 
@@ -391,6 +439,36 @@ class EdslTest(parameterized.TestCase):
             ),
         )
 
+    def test_interned_vtypes(self):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(np.array([1.0, 2.0, 3.0], dtype=np.float64))
+            x_shape = edsl.shape(x)
+            lt = edsl.less(x, x)
+            gt = edsl.greater(x, x)
+            ones = edsl.ones(x_shape, dtypes.float64)
+            zeros = edsl.zeros(x_shape, dtypes.float64)
+
+        assert lt.vtype is gt.vtype
+        assert ones.vtype is zeros.vtype is x.vtype
+        assert x_shape.vtype is edsl.shape(x, placement=alice).vtype
+
+        with alice:
+            y = edsl.constant(np.array([1.0], dtype=np.float32))
+            y_cast = edsl.cast(y, dtypes.float64)
+        assert y_cast.vtype is x.vtype
+        arg = edsl.Argument(alice, dtype=dtypes.float64)
+        assert arg.vtype is x.vtype
+
+        with alice:
+            key = edsl.constant("foo")
+            x_load = edsl.load(key, dtype=dtypes.float64)
+            f0, f1 = edsl.constant(1.0), edsl.constant(2.0)
+            i0, i1 = edsl.constant(1), edsl.constant(2)
+        assert x_load.inputs[1].vtype is key.vtype
+        assert f0.vtype is f1.vtype
+        assert i0.vtype is i1.vtype
+
     def test_relu(self):
         player0 = edsl.host_placement(name="player0")
 
@@ -522,6 +600,21 @@ class EdslTest(parameterized.TestCase):
             ),
         )
 
+    def test_reshape_shares_shape_constant(self):
+        alice = edsl.host_placement(name="alice")
+        bob = edsl.host_placement(name="bob")
+        rep = edsl.replicated_placement(name="rep", players=[alice, bob, alice])
+        x = edsl.constant(np.array([1.0, 2.0, 3.0, 4.0]), placement=alice)
+
+        y0 = edsl.reshape(x, (2, 2), placement=alice)
+        y1 = edsl.reshape(x, [2, 2], placement=rep)
+        y2 = edsl.reshape(x, (4, 1), placement=alice)
+        y3 = edsl.reshape(x, (2, 2), placement=bob)
+        assert y0.inputs[1] is y1.inputs[1]
+        assert y0.inputs[1] is not y2.inputs[1]
+        assert y0.inputs[1] is not y3.inputs[1]
+        assert y3.inputs[1].placement == bob
+
     @parameterized.parameters(
         (np.array(1), np.array([[1]])),
     )
@@ -601,6 +694,75 @@ class EdslTest(parameterized.TestCase):
             ),
         )
 
+    @parameterized.parameters(
+        (slice(1, 2), [slice(1, 2)]),
+        ((slice(None, 1), slice(0, 2, 1)), [slice(None, 1), slice(0, 2, 1)]),
+        ((Ellipsis, slice(0, 1)), [slice(None), slice(0, 1)]),
+    )
+    def test_tensor_slicing_sugar(self, slice_spec, expected_slices):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(np.ones((2, 3), dtype=np.float64))
+            x_sliced = x[slice_spec]
+        assert isinstance(x_sliced, edsl.StridedSliceExpression)
+        assert list(x_sliced.slices) == expected_slices
+
+    @parameterized.parameters(
+        (Ellipsis,),
+        ((slice(None), slice(None)),),
+        ((Ellipsis, slice(None, None, None)),),
+    )
+    def test_trivial_slicing_is_kept(self, slice_spec):
+        # identity lacks replicated kernels for some dtypes that slicing supports,
+        # so a full slice must not be rewritten into an identity
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(np.ones((2, 3), dtype=np.float64))
+            x_sliced = x[slice_spec]
+        assert isinstance(x_sliced, edsl.StridedSliceExpression)
+        assert x_sliced.inputs[0] is x
+
+    @parameterized.parameters((slice(0, 1),), ((0, 1),))
+    def test_shape_slicing_sugar(self, slice_spec):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(np.ones((2, 3), dtype=np.float64))
+            shape_sliced = edsl.shape(x)[slice_spec]
+        assert isinstance(shape_sliced, edsl.SliceExpression)
+        assert (shape_sliced.begin, shape_sliced.end) == (0, 1)
+
+    def test_slicing_unsliceable_vtype(self):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(1.0)
+        self.assertRaises(IndexError, lambda: x[0:1])
+
+    def test_expressions_hash_by_identity(self):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(1.0)
+            y0 = edsl.add(x, x)
+            y1 = edsl.add(x, x)
+        assert type(y0).__hash__ is object.__hash__
+        assert len({y0: 0, y1: 1}) == 2
+
+    @parameterized.parameters(
+        (1.0, ty.StringType()),
+        (1, ty.BytesType()),
+        (1, ty.TensorType(dtypes.bool_)),
+    )
+    def test_numeric_constant_non_numeric_vtype(self, value, vtype):
+        alice = edsl.host_placement("alice")
+        self.assertRaises(TypeError, edsl.constant, value, vtype=vtype, placement=alice)
+
+    def test_arithmetic_on_non_numeric_vtype(self):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.constant(1.0)
+            s = edsl.constant("foo")
+        self.assertRaises(TypeError, lambda: x + s)
+        self.assertRaises(TypeError, lambda: -s)
+
     @parameterized.parameters({"axis": axis} for axis in [0, [0, 1]])
     def test_unsqueeze(self, axis):
         player0 = edsl.host_placement(name="player0")
@@ -685,6 +847,22 @@ class EdslTest(parameterized.TestCase):
             signature=ops.OpSignature({}, ty.TensorType(dtypes.float64)),
         )
 
+    @parameterized.parameters(*zip(_NUMPY_DTYPES, _MOOSE_DTYPES))
+    def test_ndarray_constant_dtype(self, np_dtype, moose_dtype):
+        player0 = edsl.host_placement(name="player0")
+        x = edsl.constant(np.array([1, 2, 3], dtype=np_dtype), placement=player0)
+        assert x.vtype == ty.TensorType(moose_dtype)
+
+    @parameterized.parameters(np.float16, np.int8, np.complex64)
+    def test_ndarray_constant_unsupported_dtype(self, np_dtype):
+        player0 = edsl.host_placement(name="player0")
+        self.assertRaises(
+            NotImplementedError,
+            edsl.constant,
+            np.array([1, 2, 3], dtype=np_dtype),
+            placement=player0,
+        )
+
     def test_load(self):
         player0 = edsl.host_placement(name="player0")
 
@@ -709,6 +887,21 @@ class EdslTest(parameterized.TestCase):
             ),
         )
 
+    def test_load_save_key_coercion(self):
+        alice = edsl.host_placement("alice")
+        with alice:
+            x = edsl.load("stored_data", dtype=dtypes.float32)
+            y = edsl.save(np.str_("saved_data"), x)
+            key, query = x.inputs
+            assert key.value == values.StringConstant("stored_data")
+            assert query.value == values.StringConstant("")
+            assert y.inputs[0].value == values.StringConstant("saved_data")
+            assert isinstance(y.inputs[0].vtype, ty.StringType)
+
+            self.assertRaises(ValueError, edsl.load, 1, dtype=dtypes.float32)
+            bad_arg = edsl.Argument(alice, vtype=ty.IntType())
+            self.assertRaises(ValueError, edsl.save, bad_arg, x)
+
     def test_load_with_query(self):
         player0 = edsl.host_placement(name="player0")
 
@@ -795,6 +988,7 @@ class EdslTest(parameterized.TestCase):
         (np.array([1.0]), None, dtypes.float64),
         (np.array([1.0], dtype=np.float32), dtypes.float32, dtypes.float32),
         (np.array([1.0]), dtypes.float64, dtypes.float64),
+        (np.array([1.0]), dtypes.float64, np.float64),
     )
     def test_cast_noop(self, input_value, from_dtype, into_dtype):
         player0 = edsl.host_placement(name="player0")
@@ -939,6 +1133,116 @@ class EdslTest(parameterized.TestCase):
             elif op.placement_name == "bob":
                 assert swapped.operations[op_name].placement_name == "alice"
 
+    def test_argument_vtype_lifting(self):
+        alice = edsl.host_placement("alice")
+        f64_tensor = ty.TensorType(dtypes.float64)
+        assert edsl.Argument(alice).vtype is None
+        assert isinstance(
+            edsl.Argument(alice, vtype=ty.StringType()).vtype, ty.StringType
+        )
+        assert edsl.Argument(alice, dtype=dtypes.float64).vtype == f64_tensor
+        arg = edsl.Argument(alice, dtype=dtypes.float64, vtype=f64_tensor)
+        assert arg.vtype is f64_tensor
+        self.assertRaises(
+            ValueError,
+            edsl.Argument,
+            alice,
+            dtype=dtypes.float32,
+            vtype=f64_tensor,
+        )
+
+    def test_computation_decorator_with_role_map(self):
+        alice = edsl.host_placement("alice")
+        role_map = {"alice": "bob"}
+
+        @edsl.computation(role_map=role_map)
+        def my_comp(x: edsl.Argument(alice, dtype=dtypes.float64)):
+            return x
+
+        assert isinstance(my_comp, edsl.AbstractComputation)
+        assert my_comp.role_map is role_map
+        assert edsl.computation()(my_comp.func).role_map is None
+        ordered_role_map = collections.OrderedDict(role_map)
+        assert my_comp.with_role_map(ordered_role_map).role_map is ordered_role_map
+        self.assertRaises(TypeError, my_comp.with_role_map, [("alice", "bob")])
+
+    def test_computation_argument_binding(self):
+        class EchoRuntime:
+            def evaluate_computation(self, computation, arguments):
+                return arguments
+
+        alice = edsl.host_placement("alice")
+
+        @edsl.computation
+        def my_comp(
+            x: edsl.Argument(alice, dtype=dtypes.float64),
+            y: edsl.Argument(alice, dtype=dtypes.float64),
+        ):
+            return x
+
+        prev_runtime = edsl.get_current_runtime()
+        edsl.set_current_runtime(EchoRuntime())
+        try:
+            assert my_comp(1, 2) == {"x": 1, "y": 2}
+            assert my_comp(1, y=2) == {"x": 1, "y": 2}
+            assert my_comp(y=2, x=1) == {"x": 1, "y": 2}
+            self.assertRaisesRegex(ValueError, "Too many", my_comp, 1, 2, 3)
+            self.assertRaisesRegex(ValueError, "more than once", my_comp, 1, x=2)
+            self.assertRaisesRegex(ValueError, "Missing", my_comp, 1)
+            self.assertRaisesRegex(ValueError, "not used", my_comp, 1, 2, z=3)
+        finally:
+            edsl.set_current_runtime(prev_runtime)
+
+    def test_placement_interning(self):
+        alice = edsl.host_placement("alice")
+        bob = edsl.host_placement("bob")
+        assert edsl.host_placement("alice") is alice
+        assert edsl.host_placement("bob") is not alice
+
+        rep = edsl.replicated_placement("rep", [alice, bob, alice])
+        assert edsl.replicated_placement("rep", [alice, bob, alice]) is rep
+        assert edsl.replicated_placement("rep", [bob, alice, bob]) is not rep
+        assert edsl.mirrored_placement("rep", [alice, bob, alice]) is not rep
+        assert hash(rep) == hash("rep")
+
+        players = [alice, bob]
+        mir = edsl.mirrored_placement("mir", players)
+        players.append(alice)
+        assert edsl.mirrored_placement("mir", [alice, bob]) is mir
+        assert mir.players == [alice, bob]
+        self.assertRaises(
+            dataclasses.FrozenInstanceError, setattr, mir, "name", "other"
+        )
+
+    def test_placement_context_nesting(self):
+        alice = edsl.host_placement("alice")
+        bob = edsl.host_placement("bob")
+        with alice:
+            with bob:
+                assert edsl.get_current_placement() is bob
+                with alice:
+                    assert edsl.get_current_placement() is alice
+                assert edsl.get_current_placement() is bob
+            assert edsl.get_current_placement() is alice
+        self.assertRaises(IndexError, edsl.get_current_placement)
+
+    def test_placement_context_is_thread_local(self):
+        alice = edsl.host_placement("alice")
+        seen_in_thread = []
+
+        def build():
+            try:
+                seen_in_thread.append(edsl.get_current_placement())
+            except IndexError:
+                seen_in_thread.append(None)
+
+        with alice:
+            thread = threading.Thread(target=build)
+            thread.start()
+            thread.join()
+            assert edsl.get_current_placement() is alice
+        assert seen_in_thread == [None]
+
     def test_tagged_output(self):
         player0 = edsl.host_placement(name="player0")
 
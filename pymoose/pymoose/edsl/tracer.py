@@ -1,5 +1,11 @@
+import hashlib
+import importlib.metadata
 import inspect
-from collections import defaultdict
+import itertools
+import os
+import pathlib
+import tempfile
+from collections import OrderedDict
 
 from pymoose.computation import computation as comp
 from pymoose.computation import operations as ops
@@ -8,6 +14,28 @@ from pymoose.computation import types as ty
 from pymoose.computation import utils
 from pymoose.edsl import base as expr
 from pymoose.pymoose import elk_compiler
+from pymoose.pymoose import moose_runtime
+
+_COMPILE_CACHE_MAXSIZE = 32
+_COMPILE_CACHE = OrderedDict()
+
+
+def _compiler_fingerprint():
+    # the package version stays the same when the extension is rebuilt locally, so
+    # compiled artifacts are also keyed on the size and mtime of the built module
+    try:
+        fingerprint = importlib.metadata.version("pymoose")
+    except importlib.metadata.PackageNotFoundError:
+        fingerprint = "unknown"
+    extension = importlib.import_module("pymoose.pymoose")
+    try:
+        extension_stat = os.stat(extension.__file__)
+    except (AttributeError, OSError):
+        return fingerprint
+    return f"{fingerprint}:{extension_stat.st_size}:{extension_stat.st_mtime_ns}"
+
+
+_COMPILER_FINGERPRINT = _compiler_fingerprint()
 
 
 def trace(abstract_computation):
@@ -17,7 +45,7 @@ def trace(abstract_computation):
             arg_name=arg_name,
             vtype=parameter.annotation.vtype,
             placement=parameter.annotation.placement,
-            inputs=[],
+            inputs=(),
         )
         for arg_name, parameter in func_signature.parameters.items()
     ]
@@ -27,17 +55,69 @@ def trace(abstract_computation):
     return logical_comp
 
 
-def trace_and_compile(abstract_computation, compiler_passes=None):
+def trace_and_compile(abstract_computation, compiler_passes=None, cache_dir=None):
     logical_computation = trace(abstract_computation)
     comp_bin = utils.serialize_computation(logical_computation)
-    physical_comp_ref = elk_compiler.compile_computation(comp_bin, compiler_passes)
+    return _compile_cached(comp_bin, compiler_passes, cache_dir)
+
+
+def clear_compile_cache():
+    """Drop every compiled computation held by the in-memory compile cache."""
+    _COMPILE_CACHE.clear()
+
+
+def _compile_cached(comp_bin, compiler_passes, cache_dir=None):
+    # tracing is deterministic, so identical computations serialize to identical
+    # bytes and we can skip re-running the compiler passes on them
+    passes_key = None if compiler_passes is None else tuple(compiler_passes)
+    hasher = hashlib.blake2b(comp_bin)
+    hasher.update(repr(passes_key).encode())
+    # compiled computations are only valid for the compiler that produced them
+    hasher.update(_COMPILER_FINGERPRINT.encode())
+    cache_key = hasher.hexdigest()
+    physical_comp_ref = _COMPILE_CACHE.get(cache_key)
+    if cache_dir is not None:
+        cache_path = pathlib.Path(cache_dir) / f"{cache_key}.moose"
+        physical_comp_ref = _load_or_compile(
+            comp_bin, compiler_passes, cache_path, physical_comp_ref
+        )
+    elif physical_comp_ref is None:
+        physical_comp_ref = elk_compiler.compile_computation(comp_bin, compiler_passes)
+    _COMPILE_CACHE[cache_key] = physical_comp_ref
+    _COMPILE_CACHE.move_to_end(cache_key)
+    if len(_COMPILE_CACHE) > _COMPILE_CACHE_MAXSIZE:
+        _COMPILE_CACHE.popitem(last=False)
+    return physical_comp_ref
+
+
+def _load_or_compile(comp_bin, compiler_passes, cache_path, physical_comp_ref=None):
+    if cache_path.exists():
+        if physical_comp_ref is not None:
+            return physical_comp_ref
+        try:
+            return moose_runtime.MooseComputation.from_disk(str(cache_path))
+        except Exception:
+            # corrupt or otherwise unreadable file; recompile and overwrite it below
+            pass
+    if physical_comp_ref is None:
+        physical_comp_ref = elk_compiler.compile_computation(comp_bin, compiler_passes)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file first so concurrent readers never see partial files
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(physical_comp_ref.to_bytes())
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
     return physical_comp_ref
 
 
 class AstTracer:
     def __init__(self, role_map=None):
         self.computation = comp.Computation(operations={}, placements={})
-        self.name_counters = defaultdict(int)
+        self.name_counters = {}
         self.operation_cache = dict()
         self.placement_cache = dict()
         self.role_map = role_map
@@ -64,9 +144,10 @@ class AstTracer:
         return self.computation
 
     def get_fresh_name(self, prefix):
-        count = self.name_counters[prefix]
-        self.name_counters[prefix] += 1
-        return f"{prefix}_{count}"
+        counter = self.name_counters.get(prefix)
+        if counter is None:
+            counter = self.name_counters[prefix] = itertools.count()
+        return f"{prefix}_{next(counter)}"
 
     def visit(self, expression):
         if expression not in self.operation_cache:
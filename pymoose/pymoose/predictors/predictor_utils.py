@@ -5,15 +5,14 @@ DEFAULT_FIXED_DTYPE = dtypes.fixed(24, 40)
 
 
 def find_attribute_in_node(node, attribute_name, enforce=True):
-    node_attr = None
     for attr in node.attribute:
         if attr.name == attribute_name:
-            node_attr = attr
-    if enforce and node_attr is None:
+            return attr
+    if enforce:
         raise ValueError(
             f"Node {node.name} does not contain attribute {attribute_name}."
         )
-    return node_attr
+    return None
 
 
 def find_input_shape(input_node):
@@ -21,43 +20,42 @@ def find_input_shape(input_node):
 
 
 def find_node_in_model_proto(model_proto, operator_name, enforce=True):
-    node = None
     for operator in model_proto.graph.node:
         if operator.name == operator_name:
-            node = operator
-    if enforce and node is None:
+            return operator
+    if enforce:
         raise ValueError(f"Model proto does not contain operator {operator_name}.")
-    return node
+    return None
 
 
 def find_initializer_in_model_proto(model_proto, operator_name, enforce=True):
-    initializer = None
     for operator in model_proto.graph.initializer:
         if operator.name == operator_name:
-            initializer = operator
-    if enforce and initializer is None:
+            return operator, operator.dims
+    if enforce:
         raise ValueError(f"Model proto does not contain operator {operator_name}.")
-    return initializer, initializer.dims
+    return None, None
 
 
 def find_activation_in_model_proto(model_proto, operator_name, enforce=True):
-    activation = None
     for operator in model_proto.graph.node:
-        if operator.output[0] == operator_name:
-            activation = operator.name
-    if enforce and activation is None:
+        if operator.output and operator.output[0] == operator_name:
+            return operator.name
+    if enforce:
         raise ValueError(f"Model proto does not contain operator {operator_name}.")
-    return activation
+    return None
 
 
 def find_parameters_in_model_proto(model_proto, operator_names, enforce=True):
-    parameters = []
-    for operator in model_proto.graph.initializer:
-        for operator_name in operator_names:
-            if operator_name in operator.name:
-                parameters.append(operator)
-    if enforce and len(parameters) == 0:
-        raise ValueError(f"Model proto does not contain operator {operator_name}.")
+    # an initializer is listed once per name it matches; callers count the results
+    parameters = [
+        operator
+        for operator in model_proto.graph.initializer
+        for operator_name in operator_names
+        if operator_name in operator.name
+    ]
+    if enforce and not parameters:
+        raise ValueError(f"Model proto does not contain operators {operator_names}.")
     return parameters
 
 
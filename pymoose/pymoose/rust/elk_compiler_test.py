@@ -1,5 +1,8 @@
 import argparse
 import logging
+import pathlib
+import tempfile
+from unittest import mock
 
 import numpy as np
 from absl.testing import absltest
@@ -42,6 +45,7 @@ class CompileComputation(parameterized.TestCase):
             "bob": "bob",
             "carole": "carole",
         }
+        pm.clear_compile_cache()
 
     def test_serde_only(self):
         self._trace_and_compile(passes=[])
@@ -49,6 +53,52 @@ class CompileComputation(parameterized.TestCase):
     def test_successful_compilation(self):
         self._trace_and_compile()
 
+    def test_compilation_is_cached(self):
+        first = pm.trace_and_compile(_reference_computation)
+        second = pm.trace_and_compile(_reference_computation)
+        self.assertIs(first, second)
+
+        uncompiled = pm.trace_and_compile(_reference_computation, compiler_passes=[])
+        self.assertIsNot(first, uncompiled)
+
+    def test_compilation_is_cached_on_disk(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = pm.trace_and_compile(_reference_computation, cache_dir=cache_dir)
+            self.assertLen(list(pathlib.Path(cache_dir).glob("*.moose")), 1)
+
+            pm.clear_compile_cache()
+            # a recompile yields identical bytes, so make sure it doesn't happen
+            with mock.patch.object(
+                pm.elk_compiler,
+                "compile_computation",
+                side_effect=AssertionError("cache file was not used"),
+            ) as compile_computation:
+                second = pm.trace_and_compile(
+                    _reference_computation, cache_dir=cache_dir
+                )
+            compile_computation.assert_not_called()
+            self.assertIsNot(first, second)
+            self.assertEqual(first.to_bytes(), second.to_bytes())
+
+    def test_compilation_is_written_to_disk_on_memory_hit(self):
+        first = pm.trace_and_compile(_reference_computation)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            second = pm.trace_and_compile(_reference_computation, cache_dir=cache_dir)
+            self.assertIs(first, second)
+            self.assertLen(list(pathlib.Path(cache_dir).glob("*.moose")), 1)
+
+    def test_corrupt_cache_file_is_recompiled(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = pm.trace_and_compile(_reference_computation, cache_dir=cache_dir)
+            (cache_path,) = pathlib.Path(cache_dir).glob("*.moose")
+            cache_path.write_bytes(b"not a computation")
+
+            pm.clear_compile_cache()
+            second = pm.trace_and_compile(_reference_computation, cache_dir=cache_dir)
+            self.assertEqual(first.to_bytes(), second.to_bytes())
+            self.assertEqual(cache_path.read_bytes(), first.to_bytes())
+            self.assertLen(list(pathlib.Path(cache_dir).iterdir()), 1)
+
     def _build_new_runtime(self):
         return moose_runtime.LocalRuntime(self.empty_storage)
 
@@ -144,6 +144,37 @@ class SliceExample(parameterized.TestCase):
         x_from_runtime = compile_and_run(slice_comp, x_arg)
         np.testing.assert_equal(x_from_runtime, x_arg[1:, 1:2])
 
+    @parameterized.parameters(
+        (Ellipsis,),
+        (slice(None, None, None),),
+    )
+    def test_rep_bool_full_slice(self, slice_spec):
+        alice = pm.host_placement(name="alice")
+        bob = pm.host_placement(name="bob")
+        carole = pm.host_placement(name="carole")
+        rep = pm.replicated_placement(name="rep", players=[alice, bob, carole])
+
+        @pm.computation
+        def my_comp(
+            x_uri: pm.Argument(placement=bob, vtype=ty.StringType()),
+        ):
+            with bob:
+                x = pm.load(x_uri, dtype=pm.float64)
+                x_fixed = pm.cast(x, dtype=pm.fixed(8, 27))
+
+            with rep:
+                z_less = pm.less(x_fixed, x_fixed + x_fixed)
+                z_sliced = z_less[slice_spec]
+
+            with bob:
+                z_host = pm.logical_or(z_sliced, z_sliced)
+                res = pm.save("sliced", z_host)
+            return res
+
+        x_arg = np.array([[1.0, -2.0, 3.0], [-4.0, 5.0, -6.0]], dtype=np.float64)
+        x_from_runtime = compile_and_run(my_comp, x_arg)
+        np.testing.assert_equal(x_from_runtime, x_arg < x_arg + x_arg)
+
     def test_shape_slice(self):
         alice = pm.host_placement("alice")
 